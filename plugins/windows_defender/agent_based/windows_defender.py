@@ -33,9 +33,15 @@ BehaviorMonitorEnabled          : True
 ...
 """
 
+import re
+import sys
 import time
-from dataclasses import dataclass
-from typing import Any, Literal, TypedDict
+from collections.abc import Callable, Iterable, Sequence
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Generic, Literal, overload, TypedDict, TypeVar
 
 from cmk.agent_based.v2 import (
     AgentSection,
@@ -78,42 +84,99 @@ class WindowsDefenderParams(TypedDict, total=False):
     OnAccessProtectionEnabled: ServiceStateType
 
 
-@dataclass(frozen=True)
+# Boolean agent values; anything else maps to None (unknown)
+_BOOL_MAP: dict[str, bool] = {"True": True, "False": False}
+
+_T = TypeVar("_T")
+
+
+class _Field(Generic[_T]):
+    """Typed read-only section attribute computed from the raw agent values."""
+
+    __slots__ = ("_getter",)
+
+    def __init__(self, getter: Callable[[dict[str, str]], _T]) -> None:
+        self._getter = getter
+
+    @overload
+    def __get__(self, section: None, owner: type | None = None) -> "_Field[_T]": ...
+
+    @overload
+    def __get__(self, section: "WindowsDefenderSection", owner: type | None = None) -> _T: ...
+
+    def __get__(
+        self, section: "WindowsDefenderSection | None", owner: type | None = None
+    ) -> "_T | _Field[_T]":
+        if section is None:
+            return self
+        return self._getter(section.raw)
+
+
+def _str_field(key: str) -> _Field[str | None]:
+    """Section attribute returning the raw agent value of key."""
+    return _Field(lambda raw: raw.get(key))
+
+
+def _bool_field(key: str) -> _Field[bool | None]:
+    """Section attribute returning the agent value of key as bool (None if unknown)."""
+    return _Field(lambda raw: _BOOL_MAP.get(raw.get(key, "")))
+
+
 class WindowsDefenderSection:
-    """Parsed Windows Defender data with type safety."""
+    """Parsed Windows Defender data.
+
+    Holds the raw key:value pairs of the agent section. Values are looked up
+    and converted on attribute access, so fields the check never reads cost nothing.
+    """
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: dict[str, str]) -> None:
+        self.raw = raw
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.raw!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WindowsDefenderSection):
+            return NotImplemented
+        return self.raw == other.raw
+
+    # Mutable raw dict, so sections are not hashable
+    __hash__ = None  # type: ignore[assignment]
 
     # Version information
-    am_engine_version: str | None
-    am_product_version: str | None
-    am_service_version: str | None
-    nis_engine_version: str | None
-    antispyware_signature_version: str | None
-    antivirus_signature_version: str | None
-    nis_signature_version: str | None
+    am_engine_version = _str_field("AMEngineVersion")
+    am_product_version = _str_field("AMProductVersion")
+    am_service_version = _str_field("AMServiceVersion")
+    nis_engine_version = _str_field("NISEngineVersion")
+    antispyware_signature_version = _str_field("AntispywareSignatureVersion")
+    antivirus_signature_version = _str_field("AntivirusSignatureVersion")
+    nis_signature_version = _str_field("NISSignatureVersion")
 
     # Signature timestamps (raw strings for later parsing with date_format param)
-    antispyware_signature_last_updated: str | None
-    antivirus_signature_last_updated: str | None
-    nis_signature_last_updated: str | None
+    antispyware_signature_last_updated = _str_field("AntispywareSignatureLastUpdated")
+    antivirus_signature_last_updated = _str_field("AntivirusSignatureLastUpdated")
+    nis_signature_last_updated = _str_field("NISSignatureLastUpdated")
 
     # Scan timestamps (raw strings)
-    full_scan_end_time: str | None
-    quick_scan_end_time: str | None
+    full_scan_end_time = _str_field("FullScanEndTime")
+    quick_scan_end_time = _str_field("QuickScanEndTime")
 
     # Service states (True/False/None if unknown)
-    am_service_enabled: bool | None
-    behavior_monitor_enabled: bool | None
-    antispyware_enabled: bool | None
-    antivirus_enabled: bool | None
-    nis_enabled: bool | None
-    realtime_protection_enabled: bool | None
-    onaccess_protection_enabled: bool | None
+    am_service_enabled = _bool_field("AMServiceEnabled")
+    behavior_monitor_enabled = _bool_field("BehaviorMonitorEnabled")
+    antispyware_enabled = _bool_field("AntispywareEnabled")
+    antivirus_enabled = _bool_field("AntivirusEnabled")
+    nis_enabled = _bool_field("NISEnabled")
+    realtime_protection_enabled = _bool_field("RealTimeProtectionEnabled")
+    onaccess_protection_enabled = _bool_field("OnAccessProtectionEnabled")
 
     # Additional info
-    am_running_mode: str | None
-    computer_state: str | None
-    is_tamper_protected: bool | None
-    is_virtual_machine: bool | None
+    am_running_mode = _str_field("AMRunningMode")
+    computer_state = _str_field("ComputerState")
+    is_tamper_protected = _bool_field("IsTamperProtected")
+    is_virtual_machine = _bool_field("IsVirtualMachine")
 
 
 # Default check parameters
@@ -135,66 +198,137 @@ WINDOWS_DEFENDER_DEFAULT_LEVELS: dict[str, Any] = {
 }
 
 # Date format configurations
+# Each timestamp format is defined once and referenced per timestamp shape below
+EU_DOT_FORMAT = "%d.%m.%Y %H:%M:%S"       # European with dots: 25.02.2021 22:37:07
+EU_SLASH_FORMAT = "%d/%m/%Y %H:%M:%S"     # European with slashes: 25/02/2021 22:37:07
+EU_AMPM_FORMAT = "%d/%m/%Y %I:%M:%S %p"   # European with AM/PM
+US_AMPM_FORMAT = "%m/%d/%Y %I:%M:%S %p"   # US with AM/PM: 11/18/2021 10:38:19 PM
+US_24H_FORMAT = "%m/%d/%Y %H:%M:%S"       # US 24h: 11/18/2021 22:38:19
+ISO_FORMAT = "%Y-%m-%d %H:%M:%S"          # ISO: 2021-02-25 22:37:07
+ISO_T_FORMAT = "%Y-%m-%dT%H:%M:%S"        # ISO with T separator
+
+# Formats to try per date_format and timestamp shape (see _timestamp_shape), in order.
 # Note: EU config also includes US AM/PM format since Windows can output mixed formats on same host
-DATE_FORMAT_CONFIGS: dict[str, list[str]] = {
-    "us": [
-        "%m/%d/%Y %I:%M:%S %p",   # US with AM/PM: 11/18/2021 10:38:19 PM
-        "%m/%d/%Y %H:%M:%S",      # US 24h: 11/18/2021 22:38:19
-    ],
-    "eu": [
-        "%d.%m.%Y %H:%M:%S",      # European with dots: 25.02.2021 22:37:07
-        "%m/%d/%Y %I:%M:%S %p",   # US AM/PM (unambiguous, include for mixed-format hosts)
-        "%d/%m/%Y %H:%M:%S",      # European with slashes: 25/02/2021 22:37:07
-        "%d/%m/%Y %I:%M:%S %p",   # European with AM/PM
-    ],
-    "iso": [
-        "%Y-%m-%d %H:%M:%S",      # ISO: 2021-02-25 22:37:07
-        "%Y-%m-%dT%H:%M:%S",      # ISO with T separator
-    ],
+DATE_FORMAT_CONFIGS: dict[str, dict[str, tuple[str, ...]]] = {
+    "us": {
+        "ampm": (US_AMPM_FORMAT,),
+        "slash": (US_24H_FORMAT,),
+    },
+    "eu": {
+        "dot": (EU_DOT_FORMAT,),
+        "ampm": (US_AMPM_FORMAT, EU_AMPM_FORMAT),  # US AM/PM first, as it is unambiguous
+        "slash": (EU_SLASH_FORMAT,),
+    },
+    "iso": {
+        "dash": (ISO_FORMAT, ISO_T_FORMAT),
+    },
 }
 
 
-def _parse_timestamp(timestamp_str: str, now: float, date_format: str = "eu") -> float | None:
-    """Parse a timestamp string and return the age in seconds.
+def _timestamp_shape(timestamp_str: str) -> str | None:
+    """Classify a timestamp by its delimiters ("ampm", "dot", "dash", "slash").
 
-    Args:
-        timestamp_str: The timestamp string to parse
-        now: Current time as Unix timestamp
-        date_format: One of "us", "eu", "iso"
+    Returns None for unknown shapes.
+    """
+    if timestamp_str.endswith(("AM", "PM", "am", "pm")):
+        return "ampm"
+    if "." in timestamp_str:
+        return "dot"
+    if "-" in timestamp_str:
+        return "dash"
+    if "/" in timestamp_str:
+        return "slash"
+    return None
 
-    Returns None if parsing fails.
+
+# Fixed-width European layout "DD.MM.YYYY HH:MM:SS", matched in C by the re module
+_EU_DOT_RE = re.compile(r"(\d{2})\.(\d{2})\.(\d{4}) (\d{2}):(\d{2}):(\d{2})", re.ASCII)
+
+
+def _fast_parse_eu(timestamp_str: str) -> float | None:
+    """Parse the fixed-width European format "DD.MM.YYYY HH:MM:SS" with a regex.
+
+    Avoids the format-string interpreter of time.strptime for the most common
+    agent output. Returns None if the string does not have the expected layout.
     """
-    if not timestamp_str:
+    match = _EU_DOT_RE.fullmatch(timestamp_str)
+    if match is None:
+        return None
+    day, month, year, hour, minute, second = map(int, match.groups())
+    try:
+        local_time = datetime(year, month, day, hour, minute, second)
+    except ValueError:
         return None
+    return time.mktime(local_time.timetuple())
 
-    timestamp_str = timestamp_str.strip()
 
-    # Get formats to try based on configuration
-    formats_to_try = DATE_FORMAT_CONFIGS.get(date_format, DATE_FORMAT_CONFIGS["eu"])
+@lru_cache(maxsize=512)
+def _strptime_cached(timestamp_str: str, date_format: str) -> tuple[float, ...]:
+    """Parse a timestamp string into Unix timestamps, one per matching format.
+
+    Agent output repeats the same timestamps until the next signature update
+    or scan, so results are cached per (timestamp_str, date_format). All matches
+    are returned in format order, as the caller skips readings in the future.
+
+    Returns an empty tuple if no configured format matches.
+    """
+    # Get formats to try based on configuration and the shape of the timestamp
+    formats_by_shape = DATE_FORMAT_CONFIGS.get(date_format, DATE_FORMAT_CONFIGS["eu"])
+    shape = _timestamp_shape(timestamp_str)
+    if shape is None:
+        # Unknown shape, try all formats of the configured date format
+        formats_to_try = tuple(chain.from_iterable(formats_by_shape.values()))
+    else:
+        formats_to_try = formats_by_shape.get(shape, ())
+
+    # Fast path for the fixed-width European format, strptime handles the rest
+    if EU_DOT_FORMAT in formats_to_try:
+        update_date = _fast_parse_eu(timestamp_str)
+        if update_date is not None:
+            return (update_date,)
 
     # Try each format
+    update_dates = []
     for fmt in formats_to_try:
         try:
-            update_date = time.mktime(time.strptime(timestamp_str, fmt))
-            age = now - update_date
-            # Sanity check: signature shouldn't be from the future (allow 1 day tolerance for TZ issues)
-            if age >= -86400:
-                return age
+            update_dates.append(time.mktime(time.strptime(timestamp_str, fmt)))
         except ValueError:
             continue
 
-    return None
+    return tuple(update_dates)
+
 
+def _timestamp_age(timestamp_str: str | None, now: float, date_format: str = "eu") -> float | None:
+    """Parse a timestamp string and return its age in seconds.
 
-def _parse_bool(value: str) -> bool | None:
-    """Parse a boolean string value."""
-    if value == "True":
-        return True
-    if value == "False":
-        return False
+    Args:
+        timestamp_str: The timestamp string to parse (None or empty if missing)
+        now: Current time as Unix timestamp
+        date_format: One of "us", "eu", "iso"
+
+    Returns None if parsing fails.
+    """
+    if not timestamp_str:
+        return None
+    # Use the first reading that is not from the future (allow 1 day tolerance for TZ
+    # issues), e.g. ambiguous AM/PM dates fall back from MM/DD to DD/MM
+    for epoch in _strptime_cached(timestamp_str.strip(), date_format):
+        age = now - epoch
+        if age >= -86400:
+            return age
     return None
 
 
+def _timestamp_ages(
+    timestamps: Iterable[str | None], now: float, date_format: str = "eu"
+) -> list[float | None]:
+    """Parse timestamp strings in one pass and return their ages in seconds.
+
+    Ages are None where parsing fails (see _timestamp_age).
+    """
+    return [_timestamp_age(timestamp_str, now, date_format) for timestamp_str in timestamps]
+
+
 def _extract_levels_tuple(levels: Any) -> tuple[float, float] | None:
     """Extract (warn, crit) tuple from ruleset level format for display purposes.
 
@@ -212,52 +346,83 @@ def _extract_levels_tuple(levels: Any) -> tuple[float, float] | None:
     return None
 
 
+@lru_cache(maxsize=64)
+def _format_thresholds(warn: float, crit: float) -> str:
+    """Format warn/crit levels for messages; cached since levels are static per rule."""
+    return f"(warn/crit at {render.timespan(warn)}/{render.timespan(crit)})"
+
+
+_INTERNED_VALUES = frozenset(("True", "False", ""))
+
+
+def _intern_value(value: str) -> str:
+    """Intern frequently repeated agent values like "True"/"False"."""
+    return sys.intern(value) if value in _INTERNED_VALUES else value
+
+
 def parse_windows_defender(string_table: StringTable) -> WindowsDefenderSection | None:
-    """Parse the Windows Defender agent output into a typed dataclass."""
+    """Parse the Windows Defender agent output into a WindowsDefenderSection."""
     if not string_table:
         return None
 
-    # Build dictionary from key:value pairs
-    raw: dict[str, str] = {}
-    for line in string_table:
-        if len(line) >= 2:
-            key = line[0].strip()
-            value = ":".join(line[1:]).strip()
-            raw[key] = value
+    # Build dictionary from key:value pairs. Only values containing colons
+    # (e.g. times like 22:37:07) were over-split by sep(58) and need rejoining.
+    # Keys and boolean values are interned, they repeat on every poll.
+    raw: dict[str, str] = {
+        sys.intern(line[0].strip()): _intern_value(
+            line[1].strip() if len(line) == 2 else ":".join(line[1:]).strip()
+        )
+        for line in string_table
+        if len(line) >= 2
+    }
 
     if not raw:
         return None
 
-    return WindowsDefenderSection(
-        # Version information
-        am_engine_version=raw.get("AMEngineVersion"),
-        am_product_version=raw.get("AMProductVersion"),
-        am_service_version=raw.get("AMServiceVersion"),
-        nis_engine_version=raw.get("NISEngineVersion"),
-        antispyware_signature_version=raw.get("AntispywareSignatureVersion"),
-        antivirus_signature_version=raw.get("AntivirusSignatureVersion"),
-        nis_signature_version=raw.get("NISSignatureVersion"),
-        # Signature timestamps (raw strings - parsed later with date_format param)
-        antispyware_signature_last_updated=raw.get("AntispywareSignatureLastUpdated"),
-        antivirus_signature_last_updated=raw.get("AntivirusSignatureLastUpdated"),
-        nis_signature_last_updated=raw.get("NISSignatureLastUpdated"),
-        # Scan timestamps (raw strings)
-        full_scan_end_time=raw.get("FullScanEndTime"),
-        quick_scan_end_time=raw.get("QuickScanEndTime"),
-        # Service states
-        am_service_enabled=_parse_bool(raw.get("AMServiceEnabled", "")),
-        behavior_monitor_enabled=_parse_bool(raw.get("BehaviorMonitorEnabled", "")),
-        antispyware_enabled=_parse_bool(raw.get("AntispywareEnabled", "")),
-        antivirus_enabled=_parse_bool(raw.get("AntivirusEnabled", "")),
-        nis_enabled=_parse_bool(raw.get("NISEnabled", "")),
-        realtime_protection_enabled=_parse_bool(raw.get("RealTimeProtectionEnabled", "")),
-        onaccess_protection_enabled=_parse_bool(raw.get("OnAccessProtectionEnabled", "")),
-        # Additional info
-        am_running_mode=raw.get("AMRunningMode"),
-        computer_state=raw.get("ComputerState"),
-        is_tamper_protected=_parse_bool(raw.get("IsTamperProtected", "")),
-        is_virtual_machine=_parse_bool(raw.get("IsVirtualMachine", "")),
-    )
+    return WindowsDefenderSection(raw)
+
+
+# Check specifications: (param_key, metric_name, label, section attribute)
+SIGNATURE_SPECS: tuple[tuple[str, str, str, str], ...] = (
+    (
+        "AntispywareSignatureLastUpdated",
+        "antispyware_sig_age",
+        "AntiSpyware signature",
+        "antispyware_signature_last_updated",
+    ),
+    (
+        "AntivirusSignatureLastUpdated",
+        "antivirus_sig_age",
+        "AntiVirus signature",
+        "antivirus_signature_last_updated",
+    ),
+    (
+        "NISSignatureLastUpdated",
+        "nis_sig_age",
+        "NIS signature",
+        "nis_signature_last_updated",
+    ),
+)
+
+SCAN_SPECS: tuple[tuple[str, str, str, str], ...] = (
+    ("FullScanEndTime", "full_scan_age", "Full Scan", "full_scan_end_time"),
+    ("QuickScanEndTime", "quick_scan_age", "Quick Scan", "quick_scan_end_time"),
+)
+
+# Service specifications: (param_key, description, section attribute)
+SERVICE_SPECS: tuple[tuple[str, str, str], ...] = (
+    ("AMServiceEnabled", "AM Service", "am_service_enabled"),
+    ("BehaviorMonitorEnabled", "Behavior Monitor", "behavior_monitor_enabled"),
+    ("AntispywareEnabled", "Antispyware", "antispyware_enabled"),
+    ("AntivirusEnabled", "Antivirus", "antivirus_enabled"),
+    ("NISEnabled", "NIS", "nis_enabled"),
+    ("RealTimeProtectionEnabled", "RealTimeProtection", "realtime_protection_enabled"),
+    ("OnAccessProtectionEnabled", "OnAccessProtection", "onaccess_protection_enabled"),
+)
+
+# Fetch all section fields of a spec table in one call (attrgetter returns a tuple)
+_SIGNATURE_GETTER = attrgetter(*(spec[3] for spec in SIGNATURE_SPECS))
+_SERVICE_GETTER = attrgetter(*(spec[2] for spec in SERVICE_SPECS))
 
 
 def discover_windows_defender(section: WindowsDefenderSection) -> DiscoveryResult:
@@ -266,36 +431,11 @@ def discover_windows_defender(section: WindowsDefenderSection) -> DiscoveryResul
 
 
 def _check_signature_ages(
-    params: WindowsDefenderParams, section: WindowsDefenderSection, now: float
+    params: WindowsDefenderParams, signature_ages: Sequence[float | None]
 ) -> CheckResult:
     """Check signature ages using check_levels for proper integration."""
 
-    date_format = params.get("date_format", "eu")  # Default to European format
-
-    signatures = [
-        (
-            "AntispywareSignatureLastUpdated",
-            "antispyware_sig_age",
-            "AntiSpyware signature",
-            section.antispyware_signature_last_updated,
-        ),
-        (
-            "AntivirusSignatureLastUpdated",
-            "antivirus_sig_age",
-            "AntiVirus signature",
-            section.antivirus_signature_last_updated,
-        ),
-        (
-            "NISSignatureLastUpdated",
-            "nis_sig_age",
-            "NIS signature",
-            section.nis_signature_last_updated,
-        ),
-    ]
-
-    for param_key, metric_name, label, timestamp_str in signatures:
-        age = _parse_timestamp(timestamp_str, now, date_format) if timestamp_str else None
-
+    for (param_key, metric_name, label, _attr), age in zip(SIGNATURE_SPECS, signature_ages):
         if age is None:
             yield Result(
                 state=State.UNKNOWN,
@@ -319,20 +459,12 @@ def _check_service_states(
 ) -> CheckResult:
     """Check service states against expected values."""
 
-    services = [
-        ("AMServiceEnabled", "AM Service", section.am_service_enabled),
-        ("BehaviorMonitorEnabled", "Behavior Monitor", section.behavior_monitor_enabled),
-        ("AntispywareEnabled", "Antispyware", section.antispyware_enabled),
-        ("AntivirusEnabled", "Antivirus", section.antivirus_enabled),
-        ("NISEnabled", "NIS", section.nis_enabled),
-        ("RealTimeProtectionEnabled", "RealTimeProtection", section.realtime_protection_enabled),
-        ("OnAccessProtectionEnabled", "OnAccessProtection", section.onaccess_protection_enabled),
-    ]
-
     issues = 0
-    ok_services = []
+    ok_count = 0
 
-    for param_key, description, current_value in services:
+    for (param_key, description, _attr), current_value in zip(
+        SERVICE_SPECS, _SERVICE_GETTER(section)
+    ):
         expected = params.get(param_key, "enabled")
 
         # Handle None (unknown state from agent)
@@ -354,35 +486,28 @@ def _check_service_states(
             )
             issues += 1
         else:
-            ok_services.append(description)
+            ok_count += 1
 
     if issues == 0:
         yield Result(
             state=State.OK,
-            summary=f"All {len(ok_services)} services in expected state",
+            summary=f"All {ok_count} services in expected state",
         )
 
 
 def _check_scan_ages(
-    params: WindowsDefenderParams, section: WindowsDefenderSection, now: float
+    params: WindowsDefenderParams, section: WindowsDefenderSection, now: float, date_format: str
 ) -> CheckResult:
     """Check scan ages if configured."""
 
-    date_format = params.get("date_format", "eu")  # Default to European format
-
-    scans = [
-        ("FullScanEndTime", "full_scan_age", "Full Scan", section.full_scan_end_time),
-        ("QuickScanEndTime", "quick_scan_age", "Quick Scan", section.quick_scan_end_time),
-    ]
-
-    for param_key, metric_name, label, timestamp_str in scans:
+    for param_key, metric_name, label, attr_name in SCAN_SPECS:
         levels = params.get(param_key)
 
         # Skip if not configured
         if levels is None:
             continue
 
-        age = _parse_timestamp(timestamp_str, now, date_format) if timestamp_str else None
+        age = _timestamp_age(getattr(section, attr_name), now, date_format)
 
         if age is None:
             # Scan has never been executed - extract thresholds for message
@@ -392,7 +517,7 @@ def _check_scan_ages(
             else:
                 warn, crit = (7 * 86400, 14 * 86400)
 
-            thresholds = f"(warn/crit at {render.timespan(warn)}/{render.timespan(crit)})"
+            thresholds = _format_thresholds(warn, crit)
             yield Result(
                 state=State.CRIT,
                 summary=f"{label} has never been executed {thresholds}",
@@ -410,35 +535,76 @@ def _check_scan_ages(
         )
 
 
-def _yield_version_info(section: WindowsDefenderSection) -> CheckResult:
-    """Yield version information as notice (details only)."""
+@lru_cache(maxsize=256)
+def _versions_result(
+    am_engine_version: str | None,
+    am_product_version: str | None,
+    nis_signature_version: str | None,
+    antivirus_signature_version: str | None,
+    antispyware_signature_version: str | None,
+) -> Result | None:
+    """Build the version notice; cached as versions only change with Defender updates.
 
+    Result objects are immutable, so polls with unchanged versions share one instance.
+    """
     versions = []
-    if section.am_engine_version:
-        versions.append(f"AM Engine: {section.am_engine_version}")
-    if section.am_product_version:
-        versions.append(f"AM Product: {section.am_product_version}")
-    if section.nis_signature_version:
-        versions.append(f"NIS Sig: {section.nis_signature_version}")
-    if section.antivirus_signature_version:
-        versions.append(f"AV Sig: {section.antivirus_signature_version}")
-    if section.antispyware_signature_version:
-        versions.append(f"AS Sig: {section.antispyware_signature_version}")
+    if am_engine_version:
+        versions.append(f"AM Engine: {am_engine_version}")
+    if am_product_version:
+        versions.append(f"AM Product: {am_product_version}")
+    if nis_signature_version:
+        versions.append(f"NIS Sig: {nis_signature_version}")
+    if antivirus_signature_version:
+        versions.append(f"AV Sig: {antivirus_signature_version}")
+    if antispyware_signature_version:
+        versions.append(f"AS Sig: {antispyware_signature_version}")
+
+    if not versions:
+        return None
+    return Result(state=State.OK, notice=f"Versions - {', '.join(versions)}")
 
-    if versions:
-        yield Result(state=State.OK, notice=f"Versions - {', '.join(versions)}")
 
-    # Additional info
+@lru_cache(maxsize=256)
+def _details_result(
+    am_running_mode: str | None,
+    is_tamper_protected: bool | None,
+    is_virtual_machine: bool | None,
+) -> Result | None:
+    """Build the additional info notice; cached like _versions_result."""
     details = []
-    if section.am_running_mode:
-        details.append(f"Running Mode: {section.am_running_mode}")
-    if section.is_tamper_protected is not None:
-        details.append(f"Tamper Protected: {'Yes' if section.is_tamper_protected else 'No'}")
-    if section.is_virtual_machine is not None:
-        details.append(f"Virtual Machine: {'Yes' if section.is_virtual_machine else 'No'}")
+    if am_running_mode:
+        details.append(f"Running Mode: {am_running_mode}")
+    if is_tamper_protected is not None:
+        details.append(f"Tamper Protected: {'Yes' if is_tamper_protected else 'No'}")
+    if is_virtual_machine is not None:
+        details.append(f"Virtual Machine: {'Yes' if is_virtual_machine else 'No'}")
+
+    if not details:
+        return None
+    return Result(state=State.OK, notice=" | ".join(details))
+
+
+def _yield_version_info(section: WindowsDefenderSection) -> CheckResult:
+    """Yield version information as notice (details only)."""
 
+    versions = _versions_result(
+        section.am_engine_version,
+        section.am_product_version,
+        section.nis_signature_version,
+        section.antivirus_signature_version,
+        section.antispyware_signature_version,
+    )
+    if versions:
+        yield versions
+
+    # Additional info
+    details = _details_result(
+        section.am_running_mode,
+        section.is_tamper_protected,
+        section.is_virtual_machine,
+    )
     if details:
-        yield Result(state=State.OK, notice=" | ".join(details))
+        yield details
 
 
 def check_windows_defender(
@@ -447,15 +613,17 @@ def check_windows_defender(
     """Check Windows Defender status."""
 
     now = time.time()
+    date_format = params.get("date_format", "eu")  # Default to European format
 
-    # Check signature ages with metrics
-    yield from _check_signature_ages(params, section, now)
+    # Check signature ages with metrics (all timestamps parsed in one pass)
+    signature_ages = _timestamp_ages(_SIGNATURE_GETTER(section), now, date_format)
+    yield from _check_signature_ages(params, signature_ages)
 
     # Check service states
     yield from _check_service_states(params, section)
 
     # Check scan ages (if configured) with metrics
-    yield from _check_scan_ages(params, section, now)
+    yield from _check_scan_ages(params, section, now, date_format)
 
     # Output version info as notice
     yield from _yield_version_info(section)
@@ -21,151 +21,164 @@ from cmk.rulesets.v1.form_specs import (
 from cmk.rulesets.v1.rule_specs import CheckParameters, HostCondition, Topic
 
 
+_DAY = 86400.0  # Seconds per day, for age level prefills
+
+# Time span template shared by all age levels (form specs are immutable)
+_DAY_HOUR_TIMESPAN = TimeSpan(displayed_magnitudes=(TimeMagnitude.DAY, TimeMagnitude.HOUR))
+
+
 def _age_levels(
     title: str,
     help_text: str,
-    default_warn_days: float,
-    default_crit_days: float,
+    prefill: tuple[float, float],
 ) -> SimpleLevels:
     """Factory function for age-based SimpleLevels with TimeSpan."""
     return SimpleLevels(
         title=Title(title),
         help_text=Help(help_text),
-        form_spec_template=TimeSpan(
-            displayed_magnitudes=[TimeMagnitude.DAY, TimeMagnitude.HOUR],
-        ),
+        form_spec_template=_DAY_HOUR_TIMESPAN,
         level_direction=LevelDirection.UPPER,
-        prefill_fixed_levels=DefaultValue(
-            value=(default_warn_days * 86400.0, default_crit_days * 86400.0)
-        ),
+        prefill_fixed_levels=DefaultValue(prefill),
     )
 
 
-def _service_state_choice(title: str, help_text: str = "Default state is enabled") -> SingleChoice:
+# Titles, choices and default shared by all service state elements
+_TITLE_ENABLED = Title("enabled")
+_TITLE_DISABLED = Title("disabled")
+_DEFAULT_ENABLED = DefaultValue("enabled")
+_DEFAULT_STATE_HELP = "Default state is enabled"
+_ENABLED_DISABLED_ELEMENTS = (
+    SingleChoiceElement(name="enabled", title=_TITLE_ENABLED),
+    SingleChoiceElement(name="disabled", title=_TITLE_DISABLED),
+)
+
+
+def _service_state_choice(title: str, help_text: str) -> SingleChoice:
     """Factory function for service state SingleChoice elements."""
     return SingleChoice(
         title=Title(title),
         help_text=Help(help_text),
-        elements=[
-            SingleChoiceElement(name="enabled", title=Title("enabled")),
-            SingleChoiceElement(name="disabled", title=Title("disabled")),
-        ],
-        prefill=DefaultValue("enabled"),
+        elements=_ENABLED_DISABLED_ELEMENTS,
+        prefill=_DEFAULT_ENABLED,
     )
 
 
+# Age level fields: (parameter key, title, help text, prefill levels in seconds)
+_AGE_FIELDS: tuple[tuple[str, str, str, tuple[float, float]], ...] = (
+    # Signature age levels
+    (
+        "AntispywareSignatureLastUpdated",
+        "Age of Anti-Spyware Signature",
+        "Maximum age of the Anti-Spyware signature before alerting",
+        (3 * _DAY, 7 * _DAY),
+    ),
+    (
+        "AntivirusSignatureLastUpdated",
+        "Age of Anti-Virus Signature",
+        "Maximum age of the Anti-Virus signature before alerting",
+        (2 * _DAY, 7 * _DAY),
+    ),
+    (
+        "NISSignatureLastUpdated",
+        "Age of NIS Signature",
+        "Maximum age of the NIS (Network Inspection System) signature before alerting",
+        (5 * _DAY, 7 * _DAY),
+    ),
+    # Scan age levels
+    (
+        "FullScanEndTime",
+        "Age of last full scan",
+        "Maximum time since the last full scan before alerting. "
+        "Leave unconfigured to not check.",
+        (7 * _DAY, 14 * _DAY),
+    ),
+    (
+        "QuickScanEndTime",
+        "Age of last quick scan",
+        "Maximum time since the last quick scan before alerting. "
+        "Leave unconfigured to not check.",
+        (2 * _DAY, 7 * _DAY),
+    ),
+)
+
+# Service state fields: (parameter key, title, help text)
+_STATE_FIELDS: tuple[tuple[str, str, str], ...] = (
+    ("AMServiceEnabled", "Expected state of AM Service", _DEFAULT_STATE_HELP),
+    ("BehaviorMonitorEnabled", "Expected state of Behavior Monitor", _DEFAULT_STATE_HELP),
+    ("AntispywareEnabled", "Expected state of Antispyware", _DEFAULT_STATE_HELP),
+    ("AntivirusEnabled", "Expected state of Antivirus", _DEFAULT_STATE_HELP),
+    (
+        "NISEnabled",
+        "Expected state of NIS",
+        "Default state is enabled. Note: NIS may be disabled on some systems.",
+    ),
+    (
+        "RealTimeProtectionEnabled",
+        "Expected state of Real Time Protection",
+        _DEFAULT_STATE_HELP,
+    ),
+    (
+        "OnAccessProtectionEnabled",
+        "Expected state of OnAccess Protection",
+        "Default state is enabled. Note: May be disabled in some environments.",
+    ),
+)
+
+
+# Built parameter form, reused across renders (form specs are immutable)
+_FORM: Dictionary | None = None
+
+
 def _parameter_form() -> Dictionary:
+    global _FORM
+    if _FORM is None:
+        _FORM = _build_form()
+    return _FORM
+
+
+def _build_form() -> Dictionary:
     return Dictionary(
         title=Title("Windows Defender signature age and state"),
         help_text=Help(
             "Configure thresholds for Windows Defender signature ages and expected service states"
         ),
-        elements={
-            # Date format configuration
-            "date_format": DictElement(
-                required=False,
-                parameter_form=SingleChoice(
-                    title=Title("Date format from Windows agent"),
-                    help_text=Help(
-                        "Select the date format used by the Windows host. "
-                        "This depends on the Windows locale settings."
-                    ),
-                    elements=[
-                        SingleChoiceElement(
-                            name="eu", title=Title("European format (DD.MM.YYYY or DD/MM/YYYY)")
-                        ),
-                        SingleChoiceElement(name="us", title=Title("US format (MM/DD/YYYY)")),
-                        SingleChoiceElement(name="iso", title=Title("ISO format (YYYY-MM-DD)")),
-                    ],
-                    prefill=DefaultValue("eu"),
-                ),
-            ),
-            # Signature age levels
-            "AntispywareSignatureLastUpdated": DictElement(
-                required=False,
-                parameter_form=_age_levels(
-                    "Age of Anti-Spyware Signature",
-                    "Maximum age of the Anti-Spyware signature before alerting",
-                    default_warn_days=3,
-                    default_crit_days=7,
-                ),
-            ),
-            "AntivirusSignatureLastUpdated": DictElement(
-                required=False,
-                parameter_form=_age_levels(
-                    "Age of Anti-Virus Signature",
-                    "Maximum age of the Anti-Virus signature before alerting",
-                    default_warn_days=2,
-                    default_crit_days=7,
-                ),
-            ),
-            "NISSignatureLastUpdated": DictElement(
-                required=False,
-                parameter_form=_age_levels(
-                    "Age of NIS Signature",
-                    "Maximum age of the NIS (Network Inspection System) signature before alerting",
-                    default_warn_days=5,
-                    default_crit_days=7,
-                ),
-            ),
-            # Scan age levels
-            "FullScanEndTime": DictElement(
-                required=False,
-                parameter_form=_age_levels(
-                    "Age of last full scan",
-                    "Maximum time since the last full scan before alerting. "
-                    "Leave unconfigured to not check.",
-                    default_warn_days=7,
-                    default_crit_days=14,
-                ),
-            ),
-            "QuickScanEndTime": DictElement(
-                required=False,
-                parameter_form=_age_levels(
-                    "Age of last quick scan",
-                    "Maximum time since the last quick scan before alerting. "
-                    "Leave unconfigured to not check.",
-                    default_warn_days=2,
-                    default_crit_days=7,
-                ),
-            ),
-            # Service state expectations
-            "AMServiceEnabled": DictElement(
-                required=False,
-                parameter_form=_service_state_choice("Expected state of AM Service"),
-            ),
-            "BehaviorMonitorEnabled": DictElement(
-                required=False,
-                parameter_form=_service_state_choice("Expected state of Behavior Monitor"),
-            ),
-            "AntispywareEnabled": DictElement(
-                required=False,
-                parameter_form=_service_state_choice("Expected state of Antispyware"),
-            ),
-            "AntivirusEnabled": DictElement(
-                required=False,
-                parameter_form=_service_state_choice("Expected state of Antivirus"),
-            ),
-            "NISEnabled": DictElement(
-                required=False,
-                parameter_form=_service_state_choice(
-                    "Expected state of NIS",
-                    "Default state is enabled. Note: NIS may be disabled on some systems.",
-                ),
-            ),
-            "RealTimeProtectionEnabled": DictElement(
-                required=False,
-                parameter_form=_service_state_choice("Expected state of Real Time Protection"),
-            ),
-            "OnAccessProtectionEnabled": DictElement(
-                required=False,
-                parameter_form=_service_state_choice(
-                    "Expected state of OnAccess Protection",
-                    "Default state is enabled. Note: May be disabled in some environments.",
+        elements=_parameter_elements(),
+    )
+
+
+def _parameter_elements() -> dict[str, DictElement]:
+    elements: dict[str, DictElement] = {
+        # Date format configuration
+        "date_format": DictElement(
+            required=False,
+            parameter_form=SingleChoice(
+                title=Title("Date format from Windows agent"),
+                help_text=Help(
+                    "Select the date format used by the Windows host. "
+                    "This depends on the Windows locale settings."
                 ),
+                elements=[
+                    SingleChoiceElement(
+                        name="eu", title=Title("European format (DD.MM.YYYY or DD/MM/YYYY)")
+                    ),
+                    SingleChoiceElement(name="us", title=Title("US format (MM/DD/YYYY)")),
+                    SingleChoiceElement(name="iso", title=Title("ISO format (YYYY-MM-DD)")),
+                ],
+                prefill=DefaultValue("eu"),
             ),
-        },
+        ),
+    }
+    # Signature and scan age levels
+    elements.update(
+        (key, DictElement(required=False, parameter_form=_age_levels(title, help_text, prefill)))
+        for key, title, help_text, prefill in _AGE_FIELDS
+    )
+    # Service state expectations
+    elements.update(
+        (key, DictElement(required=False, parameter_form=_service_state_choice(title, help_text)))
+        for key, title, help_text in _STATE_FIELDS
     )
+    return elements
 
 
 rule_spec_windows_defender = CheckParameters(